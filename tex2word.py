@@ -1,12 +1,20 @@
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # SET THIS TO YOUR .bib FILENAME (must be in the folder or use full path)
 BIBFILE = "references.bib"  # Change this as needed
 
+# Resolved pandoc path, cached after the first successful probe
+_PANDOC_PATH = None
+
 def check_pandoc():
     """Check if pandoc is installed and available."""
+    global _PANDOC_PATH
+    if _PANDOC_PATH is not None:
+        return _PANDOC_PATH
+    
     # Common pandoc installation paths
     common_paths = [
         'pandoc',  # Standard PATH
@@ -24,6 +32,7 @@ def check_pandoc():
                                   capture_output=True, text=True, check=True)
             print("Pandoc found:", result.stdout.split('\n')[0])
             print(f"Using pandoc at: {pandoc_path}")
+            _PANDOC_PATH = pandoc_path
             return pandoc_path
         except (subprocess.CalledProcessError, FileNotFoundError):
             continue
@@ -50,9 +59,6 @@ def convert_tex_to_word(folder_path):
     if not pandoc_path:
         return
     
-    if not check_pandoc():
-        return
-    
     # Check if bibliography file exists
     bib_path = os.path.join(folder_path, BIBFILE)
     use_bibliography = os.path.exists(bib_path)
@@ -62,58 +68,94 @@ def convert_tex_to_word(folder_path):
     else:
         print(f"No bibliography file found ({BIBFILE}). Converting without bibliography.")
     
+    tasks = []
+    skipped_count = 0
+    
+    bib_mtime = os.path.getmtime(bib_path) if use_bibliography else 0
+    
+    with os.scandir(folder_path) as entries:
+        tex_entries = [e for e in entries if e.is_file() and e.name.endswith('.tex')]
+    
+    for entry in tex_entries:
+        filename = entry.name
+        tex_path = entry.path
+        output_basename = os.path.splitext(filename)[0]
+        docx_path = os.path.join(folder_path, output_basename + '.docx')
+        
+        # Skip files whose .docx is newer than the source and bibliography
+        # (stat the path itself so case-insensitive filesystems still match)
+        src_mtime = max(entry.stat().st_mtime, bib_mtime)
+        try:
+            docx_mtime = os.stat(docx_path).st_mtime
+        except FileNotFoundError:
+            docx_mtime = -1
+        if docx_mtime >= src_mtime:
+            print(f"↷ up-to-date: {output_basename}.docx")
+            skipped_count += 1
+            continue
+        
+        print(f"Converting {filename} to {output_basename}.docx...")
+        
+        # Build pandoc command
+        cmd = [pandoc_path, tex_path, '-o', docx_path]
+        
+        # Add bibliography if available
+        if use_bibliography:
+            cmd.extend(['--bibliography', bib_path])
+            cmd.extend(['--citeproc'])  # Process citations
+        
+        # Add additional pandoc options for better Word output
+        cmd.extend([
+            '--from', 'latex',
+            '--to', 'docx',
+            '--standalone'
+        ])
+        
+        tasks.append((filename, output_basename, cmd))
+    
+    # Each pandoc run is an independent subprocess, so run them concurrently
+    def run_one(task):
+        filename, output_basename, cmd = task
+        try:
+            subprocess.run(
+                cmd,
+                cwd=folder_path,
+                stdout=subprocess.DEVNULL,  # Output goes to docx_path
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True
+            )
+            return filename, True, None
+        except subprocess.CalledProcessError as e:
+            return filename, False, e.stderr
+        except Exception as e:
+            return filename, False, e
+    
+    results = []
+    if tasks:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(run_one, tasks))
+    
     converted_count = 0
     
-    for filename in os.listdir(folder_path):
-        if filename.endswith('.tex'):
-            tex_path = os.path.join(folder_path, filename)
-            output_basename = os.path.splitext(filename)[0]
-            docx_path = os.path.join(folder_path, output_basename + '.docx')
-            
-            print(f"Converting {filename} to {output_basename}.docx...")
-            
-            # Build pandoc command
-            cmd = [pandoc_path, tex_path, '-o', docx_path]
-            
-            # Add bibliography if available
-            if use_bibliography:
-                cmd.extend(['--bibliography', bib_path])
-                cmd.extend(['--citeproc'])  # Process citations
-            
-            # Add additional pandoc options for better Word output
-            cmd.extend([
-                '--from', 'latex',
-                '--to', 'docx',
-                '--standalone'
-            ])
-            
-            try:
-                # Run pandoc conversion
-                result = subprocess.run(
-                    cmd,
-                    cwd=folder_path,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                
-                print(f"✓ Successfully converted: {output_basename}.docx")
-                converted_count += 1
-                
-            except subprocess.CalledProcessError as e:
-                print(f"✗ Error converting {filename}:")
-                print(f"  Command: {' '.join(cmd)}")
-                print(f"  Error output: {e.stderr}")
-                continue
-            
-            except Exception as e:
-                print(f"✗ Unexpected error converting {filename}: {str(e)}")
-                continue
+    for (filename, output_basename, cmd), (_, success, error) in zip(tasks, results):
+        if success:
+            print(f"✓ Successfully converted: {output_basename}.docx")
+            converted_count += 1
+        elif isinstance(error, Exception):
+            print(f"✗ Unexpected error converting {filename}: {str(error)}")
+        else:
+            print(f"✗ Error converting {filename}:")
+            print(f"  Command: {' '.join(cmd)}")
+            print(f"  Error output: {error}")
     
     if converted_count > 0:
-        print(f"\nConversion complete! {converted_count} file(s) converted successfully.")
+        print(f"\nConversion complete! {converted_count} file(s) converted successfully, "
+              f"{skipped_count} already up to date.")
+    elif skipped_count > 0 and not tasks:
+        print(f"\nAll {skipped_count} file(s) already up to date.")
     else:
-        print("\nNo files were converted successfully.")
+        print(f"\nNo files were converted successfully ({skipped_count} already up to date).")
 
 def main():
     print("LaTeX to Word Document Converter")
@@ -135,7 +177,8 @@ def main():
         return
     
     # Check for .tex files
-    tex_files = [f for f in os.listdir(folder) if f.endswith('.tex')]
+    with os.scandir(folder) as entries:
+        tex_files = [e.name for e in entries if e.is_file() and e.name.endswith('.tex')]
     if not tex_files:
         print(f"ERROR: No .tex files found in '{folder}'.")
         return